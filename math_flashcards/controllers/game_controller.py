@@ -9,6 +9,7 @@ from math_flashcards.models.player import Player
 from math_flashcards.models.game_session import GameSession
 from math_flashcards.views.game_window import GameWindow
 from math_flashcards.views.login_dialog import LoginDialog
+from math_flashcards.views._text_cache import clear_text_cache
 from math_flashcards.controllers.analytics_controller import AnalyticsController
 from math_flashcards.controllers.player_controller import PlayerController
 
@@ -126,6 +127,7 @@ class GameController:
                 success = self._handle_player_selection(selected_name)
                 if success:
                     self.state = GameState.PLAYING
+                    self.login_dialog.close()
         
         self.login_dialog.update(current_time)
         self.login_dialog.draw()
@@ -235,14 +237,21 @@ class GameController:
         # Update layout dimensions
         self.layout.WINDOW_WIDTH = width
         self.layout.WINDOW_HEIGHT = height
+
+        # The views below are rebuilt with new fonts; text cached for the
+        # old fonts can never be hit again
+        clear_text_cache()
         
         if self.game_window:
             self.game_window = GameWindow(self.width, self.height)
             self.game_window.set_game_session(self.game_session)
         
         if self.login_dialog:
-            self.login_dialog = LoginDialog(self.screen, self.layout)
-            self.login_dialog.set_player_list(self.player_controller.load_players())
+            self.login_dialog.close()
+            self.login_dialog = None
+            if self.state == GameState.LOGIN:
+                self.login_dialog = LoginDialog(self.screen, self.layout)
+                self.login_dialog.set_player_list(self.player_controller.load_players())
 
     def _check_auto_save(self, current_time: int) -> None:
         """Check and perform auto-save if needed"""
@@ -0,0 +1,71 @@
+"""
+Precomputed button state colors
+-------------------------------
+Buttons derive their fill and border colors from a base color using a few
+fixed blend factors. The results for every color of the application palette
+are computed once at import, so buttons built from palette colors only look
+them up.
+"""
+from typing import Dict, Tuple
+from math_flashcards.utils.constants import Colors
+
+RGB = Tuple[int, int, int]
+StateColors = Tuple[Dict[str, RGB], Dict[str, RGB], Dict[str, RGB]]
+
+
+def _compute_state_colors(base_color: RGB) -> StateColors:
+    """Derive the fill, border and pressed fill color of every button state"""
+    r, g, b = base_color
+    state_fill = {
+        # Intensify the base color for selected state
+        'selected': (
+            min(255, int(r * 1.2)),
+            min(255, int(g * 1.2)),
+            min(255, int(b * 1.2))
+        ),
+        # Lighten the base color for hover
+        'hover': (
+            min(255, int(r * 0.95 + 255 * 0.05)),
+            min(255, int(g * 0.95 + 255 * 0.05)),
+            min(255, int(b * 0.95 + 255 * 0.05))
+        ),
+        # Normal state - slightly lighter than base
+        'normal': (
+            min(255, int(r * 0.9 + 255 * 0.1)),
+            min(255, int(g * 0.9 + 255 * 0.1)),
+            min(255, int(b * 0.9 + 255 * 0.1))
+        ),
+        'disabled': Colors.WIN_GRAY
+    }
+    state_border = {
+        'selected': (
+            max(0, int(r * 0.6)),
+            max(0, int(g * 0.6)),
+            max(0, int(b * 0.6))
+        ),
+        'hover': base_color,
+        'normal': base_color,
+        'disabled': Colors.BORDER_GRAY
+    }
+    # Darken the fill color when pressed
+    pressed_fill = {
+        state: tuple(max(0, int(c * 0.8)) for c in fill)
+        for state, fill in state_fill.items()
+    }
+    return state_fill, state_border, pressed_fill
+
+
+# State colors for every color in the palette
+STATE_TABLE: Dict[RGB, StateColors] = {
+    color: _compute_state_colors(color)
+    for name, color in vars(Colors).items()
+    if not name.startswith('_') and isinstance(color, tuple)
+}
+
+
+def button_state_colors(base_color: RGB) -> StateColors:
+    """Return the state colors for a base color, computing them if it is not in the palette"""
+    state_colors = STATE_TABLE.get(tuple(base_color))
+    if state_colors is None:
+        state_colors = _compute_state_colors(base_color)
+    return state_colors
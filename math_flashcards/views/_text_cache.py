@@ -0,0 +1,37 @@
+"""
+Shared text render cache
+------------------------
+Rendering text is one of the most expensive things the views do, and the same
+strings are drawn by many widgets on every frame. Rendered surfaces are kept
+in one least recently used cache shared by all views, so widgets that are
+rebuilt on a layout change reuse earlier renders.
+"""
+from functools import lru_cache
+from typing import Tuple
+import pygame
+
+
+@lru_cache(maxsize=4096)
+def render_text(font_id: int, font: pygame.font.Font, text: str,
+                color: Tuple[int, ...]) -> pygame.Surface:
+    """Render antialiased text, converted to the display format once one exists
+
+    The font is part of the cache key, which keeps it alive, so its id can
+    not be reused by another font while its renders are cached.
+    """
+    text_surface = font.render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        # Match the display's pixel format so later blits take the fast path
+        text_surface = text_surface.convert_alpha()
+    return text_surface
+
+
+def render_cached(font: pygame.font.Font, text: str,
+                  color: Tuple[int, ...]) -> pygame.Surface:
+    """Render antialiased text, reusing the surface from earlier identical calls"""
+    return render_text(id(font), font, text, tuple(color))
+
+
+def clear_text_cache() -> None:
+    """Drop all cached text, e.g. after fonts are recreated"""
+    render_text.cache_clear()
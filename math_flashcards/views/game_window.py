@@ -6,7 +6,10 @@ from datetime import datetime
 from math_flashcards.utils.constants import Colors, Layout, DifficultyLevel, GameSettings
 from math_flashcards.models.player import Player
 from math_flashcards.views.login_dialog import LoginDialog
-from math_flashcards.views.ui_components import Button, ListItem, StatsPanel
+from math_flashcards.views.ui_components import (
+    Button, ListItem, StatsPanel, WidgetRegistry, rounded_rect, vertical_gradient
+)
+from math_flashcards.views._text_cache import render_cached
 from math_flashcards.utils.version import (
     VERSION, APP_NAME, APP_AUTHOR, APP_COPYRIGHT,
     APP_LICENSE, APP_REPOSITORY, VERSION
@@ -74,6 +77,19 @@ class GameWindow:
         # Game session will be set after player selection
         self.game_session: Optional[Any] = None
 
+        # Static background layers, built on first draw
+        self._background: Optional[pygame.Surface] = None
+        self._symbol_layer: Optional[pygame.Surface] = None
+        self._symbol_layer_symbols: Optional[list] = None
+        self._overlay: Optional[pygame.Surface] = None
+        self._triangle_glow: Optional[list] = None
+        self._triangle_glow_key: Optional[Tuple[int, int, int]] = None
+        self._panel_headers: Dict[Tuple[str, int, int], pygame.Surface] = {}
+        self._number_boxes: Optional[Tuple[tuple, list]] = None
+
+        # Stats panel, kept across resizes so it keeps its session
+        self.stats_panel = StatsPanel(self.layout)
+
         # Initialize UI components
         self._init_ui_components()
 
@@ -122,9 +138,38 @@ class GameWindow:
             text_color=Colors.WHITE,
             border_radius=25
         )
-        
-        # Stats panel
-        self.stats_panel = StatsPanel(self.layout)
+
+        # Sidebar and game buttons share one hover query per frame
+        self._hover_registry = WidgetRegistry([
+            *self.operation_items.values(),
+            *self.difficulty_buttons.values(),
+            self.submit_button,
+            self.load_button,
+            self.quit_button
+        ])
+
+        # Admin panel geometry only depends on the window size
+        self._update_admin_panel_layout()
+
+    def _update_admin_panel_layout(self) -> None:
+        """Compute admin panel and content rects for the current window size"""
+        panel_width = min(600, self.layout.WINDOW_WIDTH - 100)
+        panel_height = min(500, self.layout.WINDOW_HEIGHT - 100)
+        self._admin_panel_rect = pygame.Rect(
+            (self.layout.WINDOW_WIDTH - panel_width) // 2,
+            (self.layout.WINDOW_HEIGHT - panel_height) // 2,
+            panel_width,
+            panel_height
+        )
+
+        # Content area sits below the 50px header
+        self._admin_header_height = 50
+        self._admin_content_rect = pygame.Rect(
+            self._admin_panel_rect.x + 20,
+            self._admin_panel_rect.y + self._admin_header_height + 10,
+            panel_width - 40,
+            panel_height - self._admin_header_height - 20
+        )
 
     def _create_operation_items(self) -> Dict[str, ListItem]:
 	    """Create operation selection items"""
@@ -195,36 +240,6 @@ class GameWindow:
         self.game_session = session
         self.stats_panel.set_game_session(session)
 
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        """Handle all game events"""
-        if not self.game_session:
-            return False
-
-        if event.type == pygame.VIDEORESIZE:
-            self._handle_resize(event.w, event.h)
-            return True
-
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            # Add this block for admin panel scroll handling
-            if self.admin_panel_open and event.button in (4, 5):  # 4 is scroll up, 5 is scroll down
-                self._handle_admin_panel_scroll(1 if event.button == 5 else -1)
-                return True
-            return self._handle_mouse_click(event.pos)
-
-        elif event.type == pygame.MOUSEBUTTONUP:
-            # Handle button release states
-            self.submit_button.handle_release()
-            self.load_button.handle_release()
-            self.quit_button.handle_release()
-            for button in self.difficulty_buttons.values():
-                button.handle_release()
-            return True
-
-        elif event.type == pygame.KEYDOWN:
-            return self.game_session.handle_input(event)
-
-        return False
-
     def _handle_resize(self, width: int, height: int) -> None:
         """Handle window resize event"""
         self.layout.WINDOW_WIDTH = width
@@ -234,6 +249,10 @@ class GameWindow:
             pygame.RESIZABLE
         )
         self._init_ui_components()
+        self.stats_panel.on_resize(self.layout.WINDOW_HEIGHT)
+
+        # Headers rendered for the old size will not be drawn again
+        self._panel_headers.clear()
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle all game events"""
@@ -361,18 +380,8 @@ class GameWindow:
             self.admin_button_pressed = False
             self.info_button_pressed = False
 
-        # Update operation item hover states
-        for item in self.operation_items.values():
-            item.update_hover(mouse_pos)
-
-        # Update difficulty button hover states
-        for button in self.difficulty_buttons.values():
-            button.update_hover(mouse_pos)
-
-        # Update main game button hover states
-        self.submit_button.update_hover(mouse_pos)
-        self.load_button.update_hover(mouse_pos)
-        self.quit_button.update_hover(mouse_pos)
+        # Update operation item, difficulty and game button hover states
+        self._hover_registry.update_hover(mouse_pos)
 
         # Update admin panel hover states if open
         if self.admin_panel_open:
@@ -390,49 +399,6 @@ class GameWindow:
         # Update game session
         self.game_session.update(current_time)
 
-    def _draw_sidebar(self) -> None:
-        """Draw the sidebar with enhanced styling"""
-        # Create sidebar surface with translucent navy overlay
-        sidebar_rect = pygame.Rect(
-            0, 0,
-            self.layout.SIDEBAR_WIDTH,
-            self.layout.WINDOW_HEIGHT
-        )
-
-        # Draw sidebar background with subtle gradient
-        sidebar_surface = pygame.Surface((sidebar_rect.width, sidebar_rect.height), pygame.SRCALPHA)
-        for y in range(sidebar_rect.height):
-            progress = y / sidebar_rect.height
-            color = self._lerp_color(
-                (245, 250, 255, 250),  # Almost white at top
-                (235, 245, 255, 250),  # Slightly blue-tinted white at bottom
-                progress
-            )
-            pygame.draw.line(sidebar_surface, color,
-                             (0, y), (sidebar_rect.width, y))
-
-        # Add subtle edge lighting
-        edge_width = 3
-        for i in range(edge_width):
-            alpha = 100 - (i * 30)
-            pygame.draw.line(
-                sidebar_surface,
-                (255, 255, 255, alpha),
-                (sidebar_rect.width - i, 0),
-                (sidebar_rect.width - i, sidebar_rect.height)
-            )
-
-        self.screen.blit(sidebar_surface, sidebar_rect)
-
-        # Rest of sidebar drawing code remains the same...
-
-    def _lerp_color(self, color1: tuple, color2: tuple, progress: float) -> tuple:
-        """Linearly interpolate between two colors"""
-        return tuple(
-            int(c1 + (c2 - c1) * progress)
-            for c1, c2 in zip(color1, color2)
-        )
-
     # Update draw() method to use new background
     def draw(self) -> None:
         """Draw the complete game interface"""
@@ -464,13 +430,13 @@ class GameWindow:
 
     def _draw_sidebar(self) -> None:
         """Draw the sidebar with enhanced styling"""
-        # ... [previous sidebar background code remains the same] ...
+        clip_rect = self.screen.get_clip()
 
         # Draw difficulty section header
         operations_height = (self.layout.HEADER_HEIGHT + self.layout.PADDING +
                              self.layout.LIST_ITEM_HEIGHT * 4)
         diff_label_y = operations_height + self.layout.SECTION_SPACING
-        diff_label = self.fonts['small'].render("Difficulty Level", True, Colors.BLACK)
+        diff_label = render_cached(self.fonts['small'], "Difficulty Level", Colors.BLACK)
         self.screen.blit(diff_label, (self.layout.PADDING, diff_label_y))
 
         # Difficulty buttons
@@ -479,14 +445,14 @@ class GameWindow:
             button.selected = (difficulty == self.game_session.state.difficulty)
             button.disabled = (difficulty == DifficultyLevel.CUSTOM and
                                not self.game_session.player.can_use_custom_mode())
-            button.draw(self.screen, self.fonts['small'])
+            button.draw(self.screen, self.fonts['small'], clip_rect)
 
         # Operation items
         for item in self.operation_items.values():
-            item.draw(self.screen, self.fonts['small'])
+            item.draw(self.screen, self.fonts['small'], clip_rect)
 
         # Stats panel at the bottom
-        self.stats_panel.draw(self.screen, self.fonts)
+        self.stats_panel.draw(self.screen, self.fonts, clip_rect)
 
     def _draw_main_content(self) -> None:
         """Draw the main content area with animated background symbols"""
@@ -516,11 +482,18 @@ class GameWindow:
             self._animation_state['is_transitioning'] = True
             self._animation_state['transition_start'] = current_time
 
-        # Create pattern surface
-        pattern_surface = pygame.Surface((content_width, content_height), pygame.SRCALPHA)
+        # Symbols are drawn into a retained layer, which only has to be
+        # redrawn while symbol sets fade or when the symbols change
+        size = (content_width, content_height)
+        if self._symbol_layer is None or self._symbol_layer.get_size() != size:
+            self._symbol_layer = pygame.Surface(size, pygame.SRCALPHA)
+            self._symbol_layer_symbols = None
+        pattern_surface = self._symbol_layer
 
         # Calculate fade progress if transitioning
         if self._animation_state['is_transitioning']:
+            pattern_surface.fill((0, 0, 0, 0))
+            self._symbol_layer_symbols = None
             progress = min(1.0, (current_time - self._animation_state['transition_start']) /
                            float(settings['background_fade_time']))
 
@@ -538,11 +511,13 @@ class GameWindow:
             if progress >= 1.0:
                 self._animation_state['is_transitioning'] = False
                 self._animation_state['previous_symbols'] = None
-        else:
+        elif self._symbol_layer_symbols is not self._animation_state['symbols']:
             # Draw current symbols at full opacity
+            pattern_surface.fill((0, 0, 0, 0))
             self._draw_symbol_set(pattern_surface,
                                   self._animation_state['symbols'],
                                   255)
+            self._symbol_layer_symbols = self._animation_state['symbols']
 
         # Draw pattern onto main screen
         self.screen.blit(pattern_surface, (self.layout.SIDEBAR_WIDTH, 0))
@@ -576,31 +551,15 @@ class GameWindow:
         # Main triangle outline with gradient effect
         pygame.draw.polygon(self.screen, Colors.NAVY_PRIMARY, triangle_points, 2)
 
-        # Calculate box positions with slight adjustments for better visual balance
-        box_positions = {
-            'left': (center_x - half_size + 40, center_y - half_size + 60),
-            'right': (center_x + half_size - 40, center_y - half_size + 60),
-            'bottom': (center_x, center_y + half_size - 40)
-        }
-
         # Get number values
         left, right, bottom = self.game_session.get_display_numbers()
         values = {'left': left, 'right': right, 'bottom': bottom}
+        missing_position = self.game_session.state.current_question.missing_position
 
         # Draw boxes with enhanced styling
-        for position, center_pos in box_positions.items():
-            # Create box rectangle
-            box_rect = pygame.Rect(
-                center_pos[0] - self.layout.INPUT_BOX_WIDTH // 2,
-                center_pos[1] - self.layout.INPUT_BOX_HEIGHT // 2,
-                self.layout.INPUT_BOX_WIDTH,
-                self.layout.INPUT_BOX_HEIGHT
-            )
-
+        boxes = self._get_number_boxes(center_x, center_y, half_size)
+        for index, (position, box_rect, shadow_rect, highlight_rect) in enumerate(boxes):
             # Draw box shadow
-            shadow_offset = 2
-            shadow_rect = box_rect.copy()
-            shadow_rect.y += shadow_offset
             pygame.draw.rect(self.screen, Colors.NAVY_DARKEST, shadow_rect,
                              border_radius=10)
 
@@ -608,16 +567,11 @@ class GameWindow:
             pygame.draw.rect(self.screen, Colors.WHITE, box_rect, border_radius=10)
 
             # Draw glossy highlight on top half
-            highlight_rect = box_rect.copy()
-            highlight_rect.height = box_rect.height // 2
-            highlight_surface = pygame.Surface(highlight_rect.size, pygame.SRCALPHA)
-            pygame.draw.rect(highlight_surface, (255, 255, 255, 25),
-                             highlight_surface.get_rect(), border_radius=10)
-            self.screen.blit(highlight_surface, highlight_rect)
+            self.screen.blit(rounded_rect(highlight_rect.size, 10, (255, 255, 255, 25)),
+                             highlight_rect)
 
             # Determine if this is the active input box
-            is_active = (self.game_session.state.current_question.missing_position ==
-                         list(box_positions.keys()).index(position))
+            is_active = missing_position == index
 
             # Draw border with glow effect for active box
             border_color = Colors.HIGHLIGHT if is_active else Colors.NAVY_PRIMARY
@@ -647,27 +601,58 @@ class GameWindow:
             if text:
                 # Add subtle text shadow for depth
                 shadow_color = (0, 0, 0, 128)
-                text_shadow = self.fonts['normal'].render(text, True, shadow_color)
-                shadow_rect = text_shadow.get_rect(center=box_rect.center)
-                shadow_rect.y += 1
-                self.screen.blit(text_shadow, shadow_rect)
+                text_shadow = render_cached(self.fonts['normal'], text, shadow_color)
+                text_shadow_rect = text_shadow.get_rect(center=box_rect.center)
+                text_shadow_rect.y += 1
+                self.screen.blit(text_shadow, text_shadow_rect)
 
                 # Draw main text
                 text_color = Colors.NAVY_PRIMARY if is_active else Colors.BLACK
-                text_surface = self.fonts['normal'].render(text, True, text_color)
+                text_surface = render_cached(self.fonts['normal'], text, text_color)
                 self.screen.blit(text_surface,
                                  text_surface.get_rect(center=box_rect.center))
 
+    def _get_number_boxes(self, center_x: int, center_y: int, half_size: int) -> list:
+        """Return the (position, box, shadow, highlight) rects of the number boxes
+
+        The rects only depend on the triangle geometry, so they are computed
+        once and reused until it changes.
+        """
+        key = (center_x, center_y, half_size,
+               self.layout.INPUT_BOX_WIDTH, self.layout.INPUT_BOX_HEIGHT)
+        if self._number_boxes is not None and self._number_boxes[0] == key:
+            return self._number_boxes[1]
+
+        # Calculate box positions with slight adjustments for better visual balance
+        box_positions = {
+            'left': (center_x - half_size + 40, center_y - half_size + 60),
+            'right': (center_x + half_size - 40, center_y - half_size + 60),
+            'bottom': (center_x, center_y + half_size - 40)
+        }
+
+        boxes = []
+        shadow_offset = 2
+        for position, center_pos in box_positions.items():
+            box_rect = pygame.Rect(
+                center_pos[0] - self.layout.INPUT_BOX_WIDTH // 2,
+                center_pos[1] - self.layout.INPUT_BOX_HEIGHT // 2,
+                self.layout.INPUT_BOX_WIDTH,
+                self.layout.INPUT_BOX_HEIGHT
+            )
+            shadow_rect = box_rect.move(0, shadow_offset)
+            highlight_rect = pygame.Rect(box_rect.topleft, (box_rect.width, box_rect.height // 2))
+            boxes.append((position, box_rect, shadow_rect, highlight_rect))
+
+        self._number_boxes = (key, boxes)
+        return boxes
+
     def _draw_about_panel(self) -> None:
         """Draw the about/info panel with game information"""
         if not self.game_session:
             return
 
-        # Create semi-transparent overlay with blur effect
-        overlay = pygame.Surface((self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(160)
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay with blur effect
+        self.screen.blit(self._get_overlay(), (0, 0))
 
         # Calculate panel dimensions with golden ratio
         panel_width = min(680, self.layout.WINDOW_WIDTH - 50)
@@ -688,32 +673,10 @@ class GameWindow:
         # Main panel
         pygame.draw.rect(self.screen, Colors.WHITE, panel_rect, border_radius=12)
 
-        # Gradient header
+        # Gradient header with glowing title
         header_height = 50
-        header_rect = pygame.Rect(panel_x, panel_y, panel_width, header_height)
-        header_surface = pygame.Surface((panel_width, header_height), pygame.SRCALPHA)
-
-        for y in range(header_height):
-            progress = y / header_height
-            color = self._lerp_color(Colors.NAVY_PRIMARY, Colors.NAVY_LIGHT, progress)
-            pygame.draw.line(header_surface, color, (0, y), (panel_width, y))
-
-        self.screen.blit(header_surface, header_rect)
-
-        # Header text with glow effect
-        header_text = self.fonts['normal'].render(APP_NAME, True, Colors.WHITE)
-        text_rect = header_text.get_rect(
-            centerx=header_rect.centerx,
-            centery=header_rect.centery
-        )
-
-        # Draw text glow
-        glow_surface = pygame.Surface((header_text.get_width() + 4, header_text.get_height() + 4), pygame.SRCALPHA)
-        glow_text = self.fonts['normal'].render(APP_NAME, True, (*Colors.NAVY_LIGHTEST, 128))
-        glow_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, glow_surface.get_height() // 2))
-        glow_surface.blit(glow_text, glow_rect)
-        self.screen.blit(glow_surface, text_rect)
-        self.screen.blit(header_text, text_rect)
+        self.screen.blit(self._get_panel_header(APP_NAME, panel_width, header_height),
+                         (panel_x, panel_y))
 
         # Content area with sections
         content_x = panel_x + 30
@@ -753,7 +716,7 @@ class GameWindow:
         # Draw sections
         for section in sections:
             # Section title with underline
-            title_surface = self.fonts['normal'].render(section['title'], True, Colors.NAVY_PRIMARY)
+            title_surface = render_cached(self.fonts['normal'], section['title'], Colors.NAVY_PRIMARY)
             self.screen.blit(title_surface, (content_x, content_y))
 
             # Animated underline
@@ -770,7 +733,7 @@ class GameWindow:
             for item in section['content']:
                 if item:  # Skip None entries
                     text, color = item
-                    text_surface = self.fonts['small'].render(text, True, color)
+                    text_surface = render_cached(self.fonts['small'], text, color)
                     self.screen.blit(text_surface, (content_x + 10, content_y))
                     content_y += line_height
 
@@ -778,32 +741,58 @@ class GameWindow:
 
         # Draw footer
         footer_text = "Click anywhere outside this panel to close"
-        footer_surface = self.fonts['small'].render(footer_text, True, Colors.TEXT_GRAY)
+        footer_surface = render_cached(self.fonts['small'], footer_text, Colors.TEXT_GRAY)
         footer_rect = footer_surface.get_rect(
             centerx=panel_rect.centerx,
             bottom=panel_rect.bottom - 15
         )
         self.screen.blit(footer_surface, footer_rect)
 
+    def _get_overlay(self) -> pygame.Surface:
+        """Return the dark panel overlay, allocated once per window size"""
+        size = (self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT)
+        if self._overlay is None or self._overlay.get_size() != size:
+            self._overlay = pygame.Surface(size).convert()
+            self._overlay.fill((0, 0, 0))
+            self._overlay.set_alpha(160)
+        return self._overlay
+
+    def _get_panel_header(self, title: str, width: int, height: int) -> pygame.Surface:
+        """Return the gradient panel header with its glowing title, rendered once"""
+        key = (title, width, height)
+        header_surface = self._panel_headers.get(key)
+        if header_surface is not None:
+            return header_surface
+
+        header_surface = vertical_gradient(
+            width, height, Colors.NAVY_PRIMARY, Colors.NAVY_LIGHT
+        ).convert()
+
+        # Header text with glow effect
+        header_text = self.fonts['normal'].render(title, True, Colors.WHITE)
+        text_rect = header_text.get_rect(center=header_surface.get_rect().center)
+
+        glow_surface = pygame.Surface((header_text.get_width() + 4, header_text.get_height() + 4), pygame.SRCALPHA)
+        glow_text = self.fonts['normal'].render(title, True, (*Colors.NAVY_LIGHTEST, 128))
+        glow_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, glow_surface.get_height() // 2))
+        glow_surface.blit(glow_text, glow_rect)
+        header_surface.blit(glow_surface, text_rect)
+        header_surface.blit(header_text, text_rect)
+
+        self._panel_headers[key] = header_surface
+        return header_surface
+
     def _draw_admin_panel(self) -> None:
         """Draw the admin panel with enhanced styling to match about panel"""
         if not self.game_session:
             return
 
-        # Create semi-transparent overlay with blur effect
-        overlay = pygame.Surface((self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(160)
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay with blur effect
+        self.screen.blit(self._get_overlay(), (0, 0))
 
-        # Calculate panel dimensions with golden ratio
-        panel_width = min(600, self.layout.WINDOW_WIDTH - 100)
-        panel_height = min(500, self.layout.WINDOW_HEIGHT - 100)
-        panel_x = (self.layout.WINDOW_WIDTH - panel_width) // 2
-        panel_y = (self.layout.WINDOW_HEIGHT - panel_height) // 2
-
-        # Draw panel background with enhanced styling
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        # Panel geometry is computed once per window size
+        panel_rect = self._admin_panel_rect
+        panel_x, panel_y, panel_width, panel_height = panel_rect
 
         # Draw shadow
         shadow_offset = 4
@@ -815,55 +804,24 @@ class GameWindow:
         # Main panel
         pygame.draw.rect(self.screen, Colors.WHITE, panel_rect, border_radius=12)
 
-        # Gradient header
-        header_height = 50
-        header_rect = pygame.Rect(panel_x, panel_y, panel_width, header_height)
-        header_surface = pygame.Surface((panel_width, header_height), pygame.SRCALPHA)
-
-        for y in range(header_height):
-            progress = y / header_height
-            color = self._lerp_color(Colors.NAVY_PRIMARY, Colors.NAVY_LIGHT, progress)
-            pygame.draw.line(header_surface, color, (0, y), (panel_width, y))
-
-        self.screen.blit(header_surface, header_rect)
-
-        # Header text with glow effect
-        header_text = self.fonts['normal'].render("Player Management", True, Colors.WHITE)
-        text_rect = header_text.get_rect(
-            centerx=header_rect.centerx,
-            centery=header_rect.centery
+        # Gradient header with glowing title
+        self.screen.blit(
+            self._get_panel_header("Player Management", panel_width, self._admin_header_height),
+            (panel_x, panel_y)
         )
 
-        # Draw text glow
-        glow_surface = pygame.Surface((header_text.get_width() + 4, header_text.get_height() + 4), pygame.SRCALPHA)
-        glow_text = self.fonts['normal'].render("Player Management", True, (*Colors.NAVY_LIGHTEST, 128))
-        glow_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, glow_surface.get_height() // 2))
-        glow_surface.blit(glow_text, glow_rect)
-        self.screen.blit(glow_surface, text_rect)
-        self.screen.blit(header_text, text_rect)
-
-        # Calculate content area
-        content_x = panel_x + 20
-        content_y = panel_y + header_height + 10
-        content_width = panel_width - 40
-        content_height = panel_height - header_height - 20
-
         # Draw player list or confirmation dialog
         if self.admin_confirm_delete:
-            self._draw_delete_confirmation(
-                content_x, content_y, content_width, content_height
-            )
+            self._draw_delete_confirmation(*self._admin_content_rect)
         else:
-            self._draw_player_list(
-                content_x, content_y, content_width, content_height
-            )
+            self._draw_player_list(*self._admin_content_rect)
 
         # Draw feedback message if exists
         if self.admin_message:
             current_time = pygame.time.get_ticks()
             if current_time - self.admin_message_timer < 2000:  # 2 second display
                 msg_color = Colors.SUCCESS if "successfully" in self.admin_message else Colors.ERROR
-                msg_surface = self.fonts['small'].render(self.admin_message, True, msg_color)
+                msg_surface = render_cached(self.fonts['small'], self.admin_message, msg_color)
                 msg_pos = (
                     panel_x + (panel_width - msg_surface.get_width()) // 2,
                     panel_y + panel_height - 30
@@ -888,15 +846,16 @@ class GameWindow:
         max_scroll = max(0, len(players) - visible_items)
 
         # Draw visible players
-        for i, player in enumerate(players[self.admin_scroll_offset:
-        self.admin_scroll_offset + visible_items]):
+        end = min(self.admin_scroll_offset + visible_items, len(players))
+        for i, player_index in enumerate(range(self.admin_scroll_offset, end)):
+            player = players[player_index]
             item_y = y + (i * item_height)
 
             # Full-width row for hover effect
             row_rect = pygame.Rect(x, item_y, width, item_height)
 
             # Hover effect
-            is_hovered = self.admin_hover_player == (i + self.admin_scroll_offset)
+            is_hovered = self.admin_hover_player == player_index
             if is_hovered:
                 # Draw a light blue background for the entire row
                 hover_color = (240, 247, 255)  # Light blue
@@ -907,7 +866,7 @@ class GameWindow:
                 pygame.draw.rect(self.screen, Colors.HIGHLIGHT, accent_rect)
 
             # Draw player name
-            name_surface = self.fonts['normal'].render(player, True, Colors.NAVY_PRIMARY)
+            name_surface = render_cached(self.fonts['normal'], player, Colors.NAVY_PRIMARY)
             name_pos = (x + 24, item_y + (item_height - name_surface.get_height()) // 2)
             self.screen.blit(name_surface, name_pos)
 
@@ -942,7 +901,7 @@ class GameWindow:
                     pygame.draw.rect(self.screen, border_color, button_rect, 1, border_radius=16)
 
                 # Draw button text
-                delete_text = self.fonts['small'].render("Delete", True, text_color)
+                delete_text = render_cached(self.fonts['small'], "Delete", text_color)
                 text_rect = delete_text.get_rect(center=button_rect.center)
                 self.screen.blit(delete_text, text_rect)
 
@@ -996,7 +955,7 @@ class GameWindow:
         """Draw delete confirmation dialog with styled buttons"""
         # Draw confirmation message
         msg = f"Are you sure you want to delete player '{self.admin_confirm_delete}'?"
-        msg_surface = self.fonts['normal'].render(msg, True, Colors.BLACK)
+        msg_surface = render_cached(self.fonts['normal'], msg, Colors.BLACK)
         msg_pos = (
             x + (width - msg_surface.get_width()) // 2,
             y + height // 3
@@ -1081,19 +1040,12 @@ class GameWindow:
             return True
 
         # Handle clicks on delete buttons
-        panel_width = min(600, self.layout.WINDOW_WIDTH - 100)
-        panel_height = min(500, self.layout.WINDOW_HEIGHT - 100)
-        panel_x = (self.layout.WINDOW_WIDTH - panel_width) // 2
-        panel_y = (self.layout.WINDOW_HEIGHT - panel_height) // 2
-
-        content_x = panel_x + 20
-        content_y = panel_y + 50  # After header
-        content_width = panel_width - 40
+        content_x, content_y, content_width, content_height = self._admin_content_rect
         item_height = 56  # Match the drawing height
 
         # Check for clicks on delete buttons
         players = self.game_session.player_controller.load_players()
-        visible_items = (panel_height - 70) // item_height
+        visible_items = content_height // item_height
 
         for i, player in enumerate(players[self.admin_scroll_offset:
         self.admin_scroll_offset + visible_items]):
@@ -1117,7 +1069,7 @@ class GameWindow:
     def _handle_admin_panel_scroll(self, y: int) -> None:
         """Handle mouse wheel scrolling in admin panel"""
         players = self.game_session.player_controller.load_players()
-        visible_items = (min(500, self.layout.WINDOW_HEIGHT - 100) - 70) // 40
+        visible_items = self._admin_content_rect.height // 40
         max_scroll = max(0, len(players) - visible_items)
 
         # Scroll up if y is positive, down if negative
@@ -1277,47 +1229,51 @@ class GameWindow:
 
     def _draw_background(self) -> None:
         """Draw the main application background with enhanced visual elements"""
-        # Create base gradient
-        gradient_surface = pygame.Surface(
-            (self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT),
-            pygame.SRCALPHA
-        )
-
-        # Enhanced gradient colors
-        top_color = (240, 245, 255)  # Light blue-white
-        bottom_color = (225, 235, 250)  # Slightly deeper blue-white
-
-        for y in range(self.layout.WINDOW_HEIGHT):
-            progress = y / self.layout.WINDOW_HEIGHT
-            color = self._lerp_color(top_color, bottom_color, progress)
-            pygame.draw.line(gradient_surface, (*color, 255),
-                             (0, y), (self.layout.WINDOW_WIDTH, y))
-
-        self.screen.blit(gradient_surface, (0, 0))
-
+        size = (self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT)
+        if self._background is None or self._background.get_size() != size:
+            # Enhanced gradient colors
+            top_color = (240, 245, 255)  # Light blue-white
+            bottom_color = (225, 235, 250)  # Slightly deeper blue-white
+            background = vertical_gradient(
+                size[0], size[1], top_color, bottom_color
+            ).convert()
+
+            # Apply pattern with proper blending, once per window size
+            background.blit(self._build_dot_pattern(size), (0, 0),
+                            special_flags=pygame.BLEND_ALPHA_SDL2)
+            self._background = background
+
+        self.screen.blit(self._background, (0, 0))
+
+    def _build_dot_pattern(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Build the dot grid pattern surface for the given window size"""
         # Create pattern surface with proper alpha
-        pattern_surface = pygame.Surface(
-            (self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT),
-            pygame.SRCALPHA
-        )
+        pattern_surface = pygame.Surface(size, pygame.SRCALPHA)
 
         # Draw dot grid pattern
         dot_spacing = 20
-        dot_radius = 1
-        dot_color = (200, 210, 240, 15)  # Increased alpha for better visibility
-
-        for x in range(0, self.layout.WINDOW_WIDTH, dot_spacing):
-            for y in range(0, self.layout.WINDOW_HEIGHT, dot_spacing):
-                offset = 5 * math.sin(y * 0.05)  # Create wave effect
-                pygame.draw.circle(
-                    pattern_surface,
-                    dot_color,
-                    (int(x + offset), y),
-                    dot_radius
-                )
-
-        # Apply pattern with proper blending
-        self.screen.blit(pattern_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        dot_color = pattern_surface.map_rgb((200, 210, 240, 15))  # Increased alpha for better visibility
+
+        # Each radius-1 dot covers the 2x2 block up and left of its center, so
+        # every dot row is four strided writes instead of one circle per dot
+        last_x = (size[0] - 1) // dot_spacing * dot_spacing
+        pixels = pygame.PixelArray(pattern_surface)
+        for y in range(0, size[1], dot_spacing):
+            wave = 5 * math.sin(y * 0.05)  # Create wave effect
+            offset = math.floor(wave)
+            # Dot centers are truncated toward zero, which only differs from
+            # floor for the first dot, where x + wave can be negative
+            first_x = int(wave)
+            for row in (y - 1, y):
+                if row < 0:
+                    continue
+                pixels[offset % dot_spacing:last_x + offset + 1:dot_spacing, row] = dot_color
+                pixels[(offset - 1) % dot_spacing:last_x + offset:dot_spacing, row] = dot_color
+                if first_x != offset and first_x == 0:
+                    pixels[0, row] = dot_color
+        pixels.close()
+
+        return pattern_surface.convert_alpha()
 
     def set_background_animation(self, **kwargs) -> None:
         """Update background animation settings
@@ -1393,20 +1349,24 @@ class GameWindow:
     def _draw_symbol_set(self, surface: pygame.Surface, symbols: list, alpha: int) -> None:
         """Draw a set of symbols with given alpha value"""
         for symbol in symbols:
-            # Create text surface
-            font = pygame.font.Font(None, symbol['size'])
-            text_surface = font.render(symbol['symbol'], True, symbol['color'])
+            # Render and rotate each symbol once, keeping it with the symbol
+            text_surface = symbol.get('surface')
+            if text_surface is None:
+                font = pygame.font.Font(None, symbol['size'])
+                text_surface = font.render(symbol['symbol'], True, symbol['color'])
+
+                # Rotate if needed
+                if symbol['angle']:
+                    text_surface = pygame.transform.rotate(text_surface, symbol['angle'])
 
-            # Rotate if needed
-            if symbol['angle']:
-                text_surface = pygame.transform.rotate(text_surface, symbol['angle'])
+                symbol['surface'] = text_surface
+                symbol['rect'] = text_surface.get_rect(center=symbol['pos'])
 
             # Set transparency
             text_surface.set_alpha(alpha)
 
             # Draw to pattern surface
-            rect = text_surface.get_rect(center=symbol['pos'])
-            surface.blit(text_surface, rect)
+            surface.blit(text_surface, symbol['rect'])
 
     def _draw_math_problem(self) -> None:
         """Draw the math problem components"""
@@ -1425,19 +1385,7 @@ class GameWindow:
         ]
 
         # Draw triangle glow effect
-        glow_colors = [
-            (65, 135, 255, 10),  # Outer glow
-            (65, 135, 255, 20),  # Middle glow
-            (65, 135, 255, 30)  # Inner glow
-        ]
-
-        for color in glow_colors:
-            glow_surface = pygame.Surface(
-                (self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT),
-                pygame.SRCALPHA
-            )
-            pygame.draw.polygon(glow_surface, color, triangle_points)
-            self.screen.blit(glow_surface, (0, 0))
+        self.screen.blits(self._get_triangle_glow(center_x, center_y, half_size), doreturn=False)
 
         # Draw main triangle
         pygame.draw.polygon(self.screen, Colors.HIGHLIGHT, triangle_points, 3)
@@ -1468,7 +1416,7 @@ class GameWindow:
             feedback_y = center_y - half_size - 80
             if self.game_session.state.feedback == 'Correct!':
                 # Draw success feedback
-                feedback_surface = self.fonts['normal'].render('Correct!', True, Colors.SUCCESS)
+                feedback_surface = render_cached(self.fonts['normal'], 'Correct!', Colors.SUCCESS)
                 feedback_pos = (center_x, feedback_y)
                 self.screen.blit(feedback_surface, feedback_surface.get_rect(center=feedback_pos))
             elif self.game_session.state.feedback == 'incorrect':
@@ -1495,7 +1443,7 @@ class GameWindow:
 
                 # Draw encouraging message
                 message = 'Almost there!'
-                message_surface = self.fonts['normal'].render(message, True, Colors.ERROR)
+                message_surface = render_cached(self.fonts['normal'], message, Colors.ERROR)
                 message_rect = message_surface.get_rect(
                     centerx=panel_width // 2,
                     centery=panel_height // 3
@@ -1504,7 +1452,7 @@ class GameWindow:
 
                 # Draw supportive subtext
                 subtext = 'Take another look at this one.'
-                subtext_surface = self.fonts['small'].render(subtext, True, Colors.TEXT_GRAY)
+                subtext_surface = render_cached(self.fonts['small'], subtext, Colors.TEXT_GRAY)
                 subtext_rect = subtext_surface.get_rect(
                     centerx=panel_width // 2,
                     centery=2 * panel_height // 3
@@ -1514,6 +1462,38 @@ class GameWindow:
                 # Apply panel with animation
                 self.screen.blit(panel_surface, panel_rect)
 
+    def _get_triangle_glow(self, center_x: int, center_y: int,
+                           half_size: int) -> list:
+        """Return the (surface, rect) blits of the triangle glow, rendered once per geometry
+
+        The outer, middle and inner glow layers are kept as separate surfaces
+        and blitted in turn, so the 8-bit blending matches three stacked
+        layers exactly. Each surface only covers the triangle's bounding box.
+        """
+        key = (center_x, center_y, half_size)
+        if self._triangle_glow_key == key:
+            return self._triangle_glow
+
+        glow_colors = [
+            (65, 135, 255, 10),  # Outer glow
+            (65, 135, 255, 20),  # Middle glow
+            (65, 135, 255, 30)  # Inner glow
+        ]
+
+        glow_rect = pygame.Rect(
+            center_x - half_size, center_y - half_size,
+            half_size * 2 + 1, half_size * 2 + 1
+        )
+        local_points = [(half_size, half_size * 2), (0, 0), (half_size * 2, 0)]
+
+        self._triangle_glow = []
+        for color in glow_colors:
+            glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
+            pygame.draw.polygon(glow_surface, color, local_points)
+            self._triangle_glow.append((glow_surface.convert_alpha(), glow_rect))
+        self._triangle_glow_key = key
+        return self._triangle_glow
+
     def _handle_admin_panel_hover(self, pos: Tuple[int, int]) -> None:
         """Update hover states in admin panel"""
         if self.admin_confirm_delete:
@@ -1523,23 +1503,14 @@ class GameWindow:
                 self.confirm_delete_button.update_hover(pos)
             return
 
-        # Calculate list area
-        panel_width = min(600, self.layout.WINDOW_WIDTH - 100)
-        panel_height = min(500, self.layout.WINDOW_HEIGHT - 100)
-        panel_x = (self.layout.WINDOW_WIDTH - panel_width) // 2
-        panel_y = (self.layout.WINDOW_HEIGHT - panel_height) // 2
-
-        content_x = panel_x + 20
-        content_y = panel_y + 50  # After header
-        content_width = panel_width - 40
         item_height = 56  # Match the height used in _draw_player_list
 
         # Check if mouse is within the list area
-        list_rect = pygame.Rect(content_x, content_y, content_width, panel_height - 70)
+        list_rect = self._admin_content_rect
 
         if list_rect.collidepoint(pos):
             # Calculate which item is being hovered
-            relative_y = pos[1] - content_y
+            relative_y = pos[1] - list_rect.y
             hovered_index = (relative_y // item_height) + self.admin_scroll_offset
 
             # Verify the index is valid
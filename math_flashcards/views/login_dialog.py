@@ -1,57 +1,79 @@
+import bisect
 import pygame
 from typing import Optional, List, Dict, Tuple
 from math_flashcards.utils.constants import Colors, Layout, GameSettings
-from math_flashcards.views.ui_components import Button, ScrollableList
+from math_flashcards.views.ui_components import Button, ScrollableList, vertical_gradient
+
+# Event constants bound once for the input handlers
+_KEYDOWN = pygame.KEYDOWN
+_MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+_K_BACKSPACE = pygame.K_BACKSPACE
+_ENTER_KEYS = frozenset((pygame.K_RETURN, pygame.K_KP_ENTER))
+_SCROLL_BUTTONS = frozenset((4, 5))  # 4 is scroll up, 5 is scroll down
+# Window events after which the whole window has to be presented again
+_EXPOSE_EVENTS = frozenset(
+    getattr(pygame, name) for name in ('VIDEOEXPOSE', 'WINDOWEXPOSED', 'WINDOWRESTORED')
+    if hasattr(pygame, name)
+)
+_get_ticks = pygame.time.get_ticks
 
 
 class PlayerInput:
     """Input field for player name with validation"""
 
+    # Validation rules, shared by all instances
+    invalid_chars = frozenset('<>:"/\\|?*')
+    _INVALID_TABLE = str.maketrans('', '', ''.join(invalid_chars))
+
     def __init__(self, rect: pygame.Rect):
         self.rect = rect
         self.text = ""
         self.cursor_visible = True
-        self.cursor_timer = 0
         self.active = True
         self.max_length = 20
         self.error_message = ""
         self.error_timer = 0
 
-        # Create validation rules
-        self.invalid_chars = set('<>:"/\\|?*')
+        # Rendered text keyed by display string, oldest entries evicted first
+        self._text_cache: Dict[str, Tuple[pygame.Surface, pygame.Surface]] = {}
+
+        # Static decorations, drawn once and blitted every frame
+        self._highlight_surface = self._build_highlight()
+        self._glow_rect = self.rect.inflate(6, 6)
+        self._glow_surface = self._build_glow()
 
     def handle_input(self, event: pygame.event.Event) -> None:
         """Handle keyboard input"""
         if not self.active:
             return
 
-        if event.key == pygame.K_BACKSPACE:
+        if event.key == _K_BACKSPACE:
             self.text = self.text[:-1]
             self.error_message = ""
-        elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):  # Modified this line
+        elif event.key in _ENTER_KEYS:
             pass  # Handled by dialog
         elif event.unicode:
-            # Validate input
-            if event.unicode in self.invalid_chars:
+            # Validate input; translate strips invalid characters in one pass
+            if event.unicode.translate(self._INVALID_TABLE) != event.unicode:
                 self.error_message = "Invalid character"
-                self.error_timer = pygame.time.get_ticks()
+                self.error_timer = _get_ticks()
                 return
 
             if len(self.text) < self.max_length:
                 self.text += event.unicode
                 self.error_message = ""
 
-    def update(self, current_time: int) -> None:
-        """Update animation states"""
-        # Update cursor blink
-        if current_time - self.cursor_timer > GameSettings.ANIMATION['cursor_blink_time']:
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = current_time
+    def update(self, current_time: int) -> bool:
+        """Update animation states, returning True if the field needs redrawing"""
+        # Cursor blinking is driven by LoginDialog's blink timer event
 
         # Clear error message after delay
         if (self.error_message and
                 current_time - self.error_timer > GameSettings.ANIMATION['feedback_duration']):
             self.error_message = ""
+            return True
+
+        return False
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the input field with modern styling"""
@@ -64,21 +86,12 @@ class PlayerInput:
         pygame.draw.rect(surface, Colors.WHITE, self.rect, border_radius=10)
 
         # Draw glossy highlight on top half
-        highlight_rect = self.rect.copy()
-        highlight_rect.height = self.rect.height // 2
-        highlight_surface = pygame.Surface(highlight_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(highlight_surface, (255, 255, 255, 25),
-                         highlight_surface.get_rect(), border_radius=10)
-        surface.blit(highlight_surface, highlight_rect)
+        surface.blit(self._highlight_surface, self.rect.topleft)
 
         # Draw border with glow effect if active
         border_color = Colors.HIGHLIGHT if self.active else Colors.BORDER_GRAY
         if self.active:
-            # Draw outer glow
-            for offset in range(3):
-                glow_rect = self.rect.inflate(offset * 2, offset * 2)
-                pygame.draw.rect(surface, (*Colors.NAVY_LIGHTEST, 30),
-                                 glow_rect, border_radius=10, width=1)
+            surface.blit(self._glow_surface, self._glow_rect)
 
         pygame.draw.rect(surface, border_color, self.rect, 2, border_radius=10)
 
@@ -88,25 +101,57 @@ class PlayerInput:
             display_text += "|"
 
         if display_text:
+            text_surface, shadow_surface = self._render_text(display_text, font)
+            text_rect = text_surface.get_rect(center=self.rect.center)
+
             # Add subtle text shadow
-            shadow_surface = font.render(display_text, True, (0, 0, 0, 128))
-            shadow_rect = shadow_surface.get_rect(center=self.rect.center)
-            shadow_rect.y += 1
-            surface.blit(shadow_surface, shadow_rect)
+            surface.blit(shadow_surface, text_rect.move(0, 1))
 
             # Draw main text
-            text_surface = font.render(display_text, True, Colors.NAVY_PRIMARY)
-            text_rect = text_surface.get_rect(center=self.rect.center)
             surface.blit(text_surface, text_rect)
 
-        # Draw error message if any
-        if self.error_message:
-            error_surface = font.render(self.error_message, True, Colors.ERROR)
-            error_pos = (self.rect.centerx, self.rect.bottom + 20)
-            surface.blit(error_surface, error_surface.get_rect(center=error_pos))
+    def _build_highlight(self) -> pygame.Surface:
+        """Render the translucent highlight covering the top half of the field"""
+        highlight_surface = pygame.Surface((self.rect.width, self.rect.height // 2), pygame.SRCALPHA)
+        pygame.draw.rect(highlight_surface, (255, 255, 255, 25),
+                         highlight_surface.get_rect(), border_radius=10)
+        return highlight_surface.convert_alpha()
+
+    def _build_glow(self) -> pygame.Surface:
+        """Render the concentric outlines shown around the field while active
+
+        The rings used to be drawn straight onto the opaque screen, which
+        ignores the color's alpha, so they are baked fully opaque to look the
+        same.
+        """
+        glow_surface = pygame.Surface(self._glow_rect.size, pygame.SRCALPHA)
+        field_rect = self.rect.move(-self._glow_rect.x, -self._glow_rect.y)
+        for offset in range(3):
+            glow_rect = field_rect.inflate(offset * 2, offset * 2)
+            pygame.draw.rect(glow_surface, Colors.NAVY_LIGHTEST,
+                             glow_rect, border_radius=10, width=1)
+        return glow_surface.convert_alpha()
+
+    def _render_text(self, display_text: str,
+                     font: pygame.font.Font) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Render the field text and its shadow, reusing surfaces for strings already typed"""
+        rendered = self._text_cache.get(display_text)
+        if rendered is None:
+            rendered = (
+                font.render(display_text, True, Colors.NAVY_PRIMARY).convert_alpha(),
+                font.render(display_text, True, (0, 0, 0, 128)).convert_alpha()
+            )
+            self._text_cache[display_text] = rendered
+            if len(self._text_cache) > self.max_length:
+                del self._text_cache[next(iter(self._text_cache))]
+        return rendered
 
 class LoginDialog:
     """Dialog for player selection and creation"""
+
+    # Posted by pygame's timer whenever the input cursor should blink
+    _BLINK_EVENT = pygame.USEREVENT + 1
+
     def __init__(self, screen: pygame.Surface, layout: Layout):
         """Initialize the login dialog"""
         self.screen = screen
@@ -114,8 +159,8 @@ class LoginDialog:
             layout = Layout()
         self.layout = layout
         
-        # Store background
-        self.background = screen.copy()
+        # Background is captured on the first draw
+        self.background: Optional[pygame.Surface] = None
         self.stored_background = False
         
         # Calculate dialog dimensions - now with fixed height
@@ -131,6 +176,7 @@ class LoginDialog:
         )
         
         # Fixed heights for components
+        self.header_height = 50
         self.title_height = 40
         self.input_section_height = 120  # Space for label, input, and create button
         self.list_section_label_height = 30
@@ -183,30 +229,121 @@ class LoginDialog:
             for size in GameSettings.FONT_SIZES
         }
 
+        # Rendered text keyed by (font, string, color)
+        self._text_cache: Dict[Tuple[str, str, Tuple[int, ...]], pygame.Surface] = {}
+
+        # Pre-render static text, it never changes or moves
+        title = "Welcome to Math Flash Cards!"
+        self._title_surf = self._text('normal', title, Colors.WHITE)
+        self._title_rect = self._title_surf.get_rect(
+            centerx=self.dialog_rect.centerx,
+            centery=self.dialog_rect.y + self.header_height // 2
+        )
+
+        self._title_glow_surf = pygame.Surface(
+            (self._title_surf.get_width() + 4, self._title_surf.get_height() + 4), pygame.SRCALPHA
+        )
+        glow_text = self._text('normal', title, (*Colors.NAVY_LIGHTEST, 128))
+        glow_rect = glow_text.get_rect(
+            center=(self._title_glow_surf.get_width() // 2, self._title_glow_surf.get_height() // 2)
+        )
+        self._title_glow_surf.blit(glow_text, glow_rect)
+
+        self._list_label_surf = self._text('small', "Player List:", Colors.NAVY_PRIMARY)
+        self._list_label_rect = self._list_label_surf.get_rect(
+            centerx=self.dialog_rect.centerx,
+            bottom=self.player_list.rect.top - 10
+        )
+
+        # Every validation error the input field can show
+        self._error_pos = (self.name_input.rect.centerx, self.name_input.rect.bottom + 20)
+        for message in ("Invalid character", "Name already exists", "Name too short"):
+            self._text('normal', message, Colors.ERROR)
+
+        # Dark overlay with blur effect, allocated once
+        self._overlay = pygame.Surface((self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT)).convert()
+        self._overlay.fill((0, 0, 0))
+        self._overlay.set_alpha(160)
+
+        # Everything else that does not change between frames
+        self._chrome_surface = self._build_chrome()
+
+        # Screen regions covered by each dynamic widget, including shadows,
+        # glow and the error message below the input field
+        self._input_region = self.name_input.rect.inflate(8, 8).union(
+            pygame.Rect(self.dialog_rect.x, self.name_input.rect.bottom, self.dialog_rect.width, 40)
+        )
+        button_rect = self.new_player_button.rect
+        self._button_region = button_rect.union(button_rect.move(0, 2))
+        scroll_up = self.player_list.scroll_up.rect
+        scroll_down = self.player_list.scroll_down.rect
+        self._list_region = self.player_list.rect.unionall([
+            scroll_up, scroll_up.move(0, 2),
+            scroll_down, scroll_down.move(0, 2)
+        ]).inflate(2, 2)
+
+        # Areas to present on the next draw; the first frame is shown in full
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+
+        # Set whenever something visible changed; draw() is skipped otherwise
+        self._dirty = True
+
+        # Blink the cursor from a timer event instead of polling every tick
+        pygame.time.set_timer(self._BLINK_EVENT, GameSettings.ANIMATION['cursor_blink_time'])
+
+    def close(self) -> None:
+        """Stop the cursor blink timer once the dialog is no longer shown"""
+        pygame.time.set_timer(self._BLINK_EVENT, 0)
+
     def set_player_list(self, players: List[str]) -> None:
         """Update the list of available players"""
         self.player_list.items = sorted(players)
 
+    def add_player(self, name: str) -> None:
+        """Insert a player name, keeping the list sorted"""
+        bisect.insort(self.player_list.items, name)
+        self.player_list.invalidate()
+        self._dirty = True
+        self._dirty_rects.append(self._list_region)
+
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """Handle input events and return selected player name when ready"""
-        if event.type == pygame.KEYDOWN:
+        if event.type == self._BLINK_EVENT:
+            self.name_input.cursor_visible = not self.name_input.cursor_visible
+            self._dirty = True
+            self._dirty_rects.append(self._input_region)
+
+        elif event.type in _EXPOSE_EVENTS:
+            # The window was uncovered or restored, repaint all of it
+            self._dirty = True
+            self._full_redraw = True
+
+        elif event.type == _KEYDOWN:
+            self._dirty = True
+            self._dirty_rects.append(self._input_region)
             self.name_input.handle_input(event)
-            if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER) and self.name_input.text.strip():  # Modified this line
+            if event.key in _ENTER_KEYS and self.name_input.text.strip():
                 return self._validate_new_player(self.name_input.text.strip())
 
-        elif event.type == pygame.MOUSEBUTTONDOWN:
+        elif event.type == _MOUSEBUTTONDOWN:
+            self._dirty = True
+            self._dirty_rects.append(self._list_region)
+
             # Handle mouse wheel scrolling
-            if event.button in (4, 5):  # 4 is scroll up, 5 is scroll down
+            if event.button in _SCROLL_BUTTONS:
                 self.player_list.handle_scroll(1 if event.button == 5 else -1)
                 return None
 
             # Handle new player button
+            self._dirty_rects.append(self._button_region)
+            self._dirty_rects.append(self._input_region)
             if (self.new_player_button.handle_click(event.pos) and
                     self.name_input.text.strip()):
                 return self._validate_new_player(self.name_input.text.strip())
 
             # Handle player list selection
-            selected = self.player_list.handle_click(event.pos)
+            selected = self.player_list.handle_click(event.pos, event.button)
             if selected:
                 return selected
 
@@ -214,122 +351,135 @@ class LoginDialog:
 
     def _validate_new_player(self, name: str) -> Optional[str]:
         """Validate new player name"""
-        if name in self.player_list.items:
+        # Items are kept sorted, so a binary search finds duplicates
+        items = self.player_list.items
+        index = bisect.bisect_left(items, name)
+        if index < len(items) and items[index] == name:
             self.name_input.error_message = "Name already exists"
-            self.name_input.error_timer = pygame.time.get_ticks()
+            self.name_input.error_timer = _get_ticks()
             return None
             
         if len(name) < 2:
             self.name_input.error_message = "Name too short"
-            self.name_input.error_timer = pygame.time.get_ticks()
+            self.name_input.error_timer = _get_ticks()
             return None
             
         return name
 
     def update(self, current_time: int) -> None:
         """Update animation states"""
-        self.name_input.update(current_time)
+        if self.name_input.update(current_time):
+            self._dirty = True
+            self._dirty_rects.append(self._input_region)
         
         # Update hover states
         mouse_pos = pygame.mouse.get_pos()
-        self.new_player_button.update_hover(mouse_pos)
-        self.player_list.update_hover(mouse_pos)
+        if self.new_player_button.update_hover(mouse_pos):
+            self._dirty = True
+            self._dirty_rects.append(self._button_region)
+        if self.player_list.update_hover(mouse_pos):
+            self._dirty = True
+            self._dirty_rects.append(self._list_region)
 
     def draw(self) -> None:
         """Draw the login dialog with enhanced styling"""
-        # Store or restore background
+        # Nothing changed since the last frame, so the screen is still current
+        if not self._dirty:
+            return
+
+        # Store the background with the darkening overlay and the dialog
+        # panel baked in, so each frame starts from one opaque blit
         if not self.stored_background:
-            self.background = self.screen.copy()
+            self.background = self.screen.copy().convert()
+            self.background.blit(self._overlay, (0, 0))
+            self.background.blit(self._chrome_surface, self._chrome_rect)
             self.stored_background = True
-        else:
-            self.screen.blit(self.background, (0, 0))
 
-        # Draw dark overlay with blur effect
-        overlay = pygame.Surface((self.layout.WINDOW_WIDTH, self.layout.WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(160)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.background, (0, 0))
 
-        # Draw dialog box with shadow
+        # Draw input field with enhanced styling
+        self.name_input.draw(self.screen, self.fonts['normal'])
+
+        # Draw error message if any
+        if self.name_input.error_message:
+            error_surface = self._text('normal', self.name_input.error_message, Colors.ERROR)
+            self.screen.blit(error_surface, error_surface.get_rect(center=self._error_pos))
+
+        # Draw create button (already styled nicely)
+        self.new_player_button.draw(self.screen, self.fonts['normal'])
+
+        # Draw enhanced player list
+        self.player_list.draw(self.screen, self.fonts['normal'])
+
+        # Present only the regions that changed, unless most of the screen did
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif self._dirty_rects:
+            dirty_area = sum(rect.width * rect.height for rect in self._dirty_rects)
+            if dirty_area > self.layout.WINDOW_WIDTH * self.layout.WINDOW_HEIGHT // 2:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self._dirty_rects)
+        self._dirty_rects.clear()
+        self._dirty = False
+
+    def _text(self, font_key: str, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        """Render text with one of the dialog fonts, reusing earlier renders"""
+        key = (font_key, text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = self.fonts[font_key].render(text, True, color).convert_alpha()
+            self._text_cache[key] = text_surface
+        return text_surface
+
+    def _build_chrome(self) -> pygame.Surface:
+        """Render the static dialog decoration (panel, header, labels) once
+
+        The surface covers the dialog and its shadow, positioned at
+        self._chrome_rect.
+        """
         shadow_offset = 4
-        shadow_rect = self.dialog_rect.copy()
+        self._chrome_rect = self.dialog_rect.inflate(shadow_offset, shadow_offset)
+        self._chrome_rect.topleft = self.dialog_rect.topleft
+        chrome = pygame.Surface(self._chrome_rect.size, pygame.SRCALPHA)
+        dialog_rect = self.dialog_rect.move(-self._chrome_rect.x, -self._chrome_rect.y)
+
+        # Draw dialog box with shadow
+        shadow_rect = dialog_rect.copy()
         shadow_rect.x += shadow_offset
         shadow_rect.y += shadow_offset
-        pygame.draw.rect(self.screen, Colors.NAVY_DARKEST, shadow_rect, border_radius=12)
+        pygame.draw.rect(chrome, Colors.NAVY_DARKEST, shadow_rect, border_radius=12)
 
         # Main panel with subtle gradient
-        dialog_surface = pygame.Surface((self.dialog_rect.width, self.dialog_rect.height), pygame.SRCALPHA)
-        for y in range(self.dialog_rect.height):
-            progress = y / self.dialog_rect.height
-            color = self._lerp_color(
-                (250, 252, 255, 255),  # Very light blue-white at top
-                (240, 245, 255, 255),  # Slightly more blue at bottom
-                progress
-            )
-            pygame.draw.line(dialog_surface, color, (0, y), (self.dialog_rect.width, y))
-
-        self.screen.blit(dialog_surface, self.dialog_rect)
-        pygame.draw.rect(self.screen, Colors.BORDER_GRAY, self.dialog_rect, 2, border_radius=12)
+        dialog_surface = vertical_gradient(
+            dialog_rect.width, dialog_rect.height,
+            (250, 252, 255, 255),  # Very light blue-white at top
+            (240, 245, 255, 255)  # Slightly more blue at bottom
+        )
+        chrome.blit(dialog_surface, dialog_rect)
+        pygame.draw.rect(chrome, Colors.BORDER_GRAY, dialog_rect, 2, border_radius=12)
 
         # Draw title with gradient header
-        header_height = 50
+        header_height = self.header_height
         header_rect = pygame.Rect(
-            self.dialog_rect.x,
-            self.dialog_rect.y,
-            self.dialog_rect.width,
+            dialog_rect.x,
+            dialog_rect.y,
+            dialog_rect.width,
             header_height
         )
-        header_surface = pygame.Surface((header_rect.width, header_height), pygame.SRCALPHA)
-
-        for y in range(header_height):
-            progress = y / header_height
-            color = self._lerp_color(Colors.NAVY_PRIMARY, Colors.NAVY_LIGHT, progress)
-            pygame.draw.line(header_surface, color, (0, y), (header_rect.width, y))
-
-        self.screen.blit(header_surface, header_rect)
-
-        # Draw title text with glow
-        title = "Welcome to Math Flash Cards!"
-        title_text = self.fonts['normal'].render(title, True, Colors.WHITE)
-        title_rect = title_text.get_rect(
-            centerx=self.dialog_rect.centerx,
-            centery=header_rect.centery
-        )
-
-        # Add glow effect
-        glow_surface = pygame.Surface((title_text.get_width() + 4, title_text.get_height() + 4), pygame.SRCALPHA)
-        glow_text = self.fonts['normal'].render(title, True, (*Colors.NAVY_LIGHTEST, 128))
-        glow_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, glow_surface.get_height() // 2))
-        glow_surface.blit(glow_text, glow_rect)
-        self.screen.blit(glow_surface, title_rect)
-        self.screen.blit(title_text, title_rect)
-
-        # Draw input field with enhanced styling
-        self.name_input.draw(self.screen, self.fonts['normal'])
-
-        # Draw create button (already styled nicely)
-        self.new_player_button.draw(self.screen, self.fonts['normal'])
-
-        # Draw player list section with enhanced styling
-        returning_text = self.fonts['small'].render(
-            "Player List:", True, Colors.NAVY_PRIMARY
-        )
-        returning_rect = returning_text.get_rect(
-            centerx=self.dialog_rect.centerx,
-            bottom=self.player_list.rect.top - 10
+        header_surface = vertical_gradient(
+            header_rect.width, header_height, Colors.NAVY_PRIMARY, Colors.NAVY_LIGHT
         )
-        self.screen.blit(returning_text, returning_rect)
+        chrome.blit(header_surface, header_rect)
 
-        # Draw enhanced player list
-        self.player_list.draw(self.screen, self.fonts['normal'])
-
-        # Update display
-        pygame.display.flip()
+        # Draw title text with glow
+        title_rect = self._title_rect.move(-self._chrome_rect.x, -self._chrome_rect.y)
+        chrome.blit(self._title_glow_surf, title_rect)
+        chrome.blit(self._title_surf, title_rect)
 
-    def _lerp_color(self, color1: tuple, color2: tuple, progress: float) -> tuple:
-        """Linearly interpolate between two colors"""
-        return tuple(
-            int(c1 + (c2 - c1) * progress)
-            for c1, c2 in zip(color1, color2)
-        )
+        # Draw player list section label
+        chrome.blit(self._list_label_surf,
+                    self._list_label_rect.move(-self._chrome_rect.x, -self._chrome_rect.y))
 
+        return chrome.convert_alpha()
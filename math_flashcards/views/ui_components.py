@@ -3,16 +3,85 @@ from typing import Dict, Optional, Tuple, Any
 from math_flashcards.utils.constants import Colors, Layout, GameSettings
 from math_flashcards.models.game_session import GameSession
 import math
-
-import pygame
-from typing import Dict, Optional, Tuple, Any
-from math_flashcards.utils.constants import Colors, Layout, GameSettings
-import math
-
-import pygame
-from typing import Dict, Optional, Tuple, Any
-from math_flashcards.utils.constants import Colors, Layout, GameSettings
-import math
+from enum import IntEnum
+from math_flashcards.views._color_lut import button_state_colors
+from math_flashcards.views._text_cache import render_cached
+
+
+def _display_alpha(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a per-pixel alpha surface to the display format once a display exists"""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
+# Rounded rectangle shapes keyed by (size, border radius, color, line width)
+_ROUNDED_RECTS: Dict[tuple, pygame.Surface] = {}
+
+
+def rounded_rect(size: Tuple[int, int], border_radius: int,
+                 color: Tuple[int, ...], width: int = 0) -> pygame.Surface:
+    """Return a rounded rectangle with transparent corners, rasterized once
+
+    width works like in pygame.draw.rect, 0 fills the shape and anything
+    else draws an outline of that width.
+    """
+    key = (tuple(size), border_radius, tuple(color), width)
+    shape = _ROUNDED_RECTS.get(key)
+    if shape is None:
+        shape = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(shape, color, shape.get_rect(), width, border_radius=border_radius)
+        shape = _ROUNDED_RECTS[key] = _display_alpha(shape)
+    return shape
+
+
+def vertical_gradient(width: int, height: int,
+                      top_color: Tuple[int, ...],
+                      bottom_color: Tuple[int, ...]) -> pygame.Surface:
+    """Create a surface filled with a top-to-bottom linear gradient
+
+    Row colors are packed into a one pixel wide column which is then
+    stretched to the full width in a single scale call, instead of drawing
+    one line per row. The surface only carries per-pixel alpha when one of
+    the colors is translucent.
+    """
+    top = tuple(top_color) + (255,) * (4 - len(top_color))
+    bottom = tuple(bottom_color) + (255,) * (4 - len(bottom_color))
+    if top[3] == bottom[3] == 255:
+        top, bottom, pixel_format = top[:3], bottom[:3], 'RGB'
+    else:
+        pixel_format = 'RGBA'
+
+    column = bytearray()
+    for y in range(height):
+        progress = y / height
+        column.extend(int(c1 + (c2 - c1) * progress) for c1, c2 in zip(top, bottom))
+
+    column_surface = pygame.image.frombuffer(bytes(column), (1, height), pixel_format)
+    return pygame.transform.scale(column_surface, (width, height))
+
+
+class _State(IntEnum):
+    """Visual states of a Button, pressed buttons keep the look of the state they sink from"""
+    NORMAL = 0
+    HOVER = 1
+    SELECTED = 2
+    DISABLED = 3
+    PRESSED_NORMAL = 4
+    PRESSED_HOVER = 5
+    PRESSED_SELECTED = 6
+
+
+_PRESSED_STATES = {
+    _State.NORMAL: _State.PRESSED_NORMAL,
+    _State.HOVER: _State.PRESSED_HOVER,
+    _State.SELECTED: _State.PRESSED_SELECTED,
+}
+
+# Disabled buttons that are also selected keep their wider border, so they get
+# their own surface slot after the one per state
+_DISABLED_SELECTED_SLOT = len(_State)
+_SURFACE_SLOTS = len(_State) + 1
 
 
 class Button:
@@ -26,8 +95,9 @@ class Button:
         self.rect = pygame.Rect(x, y, width, height)
         self.original_rect = self.rect.copy()
         self.text = text
-        self.base_color = color if color is not None else Colors.HIGHLIGHT
-        self.text_color = text_color if text_color is not None else Colors.WHITE
+        self._base_color = color if color is not None else Colors.HIGHLIGHT
+        self._text_color = text_color if text_color is not None else Colors.WHITE
+        self._compute_palette()
         self.style = style
         self.hover = False
         self.disabled = False
@@ -35,97 +105,163 @@ class Button:
         self.border_radius = border_radius
         self._pressed = False
         self._press_offset = 2
+        # Pressed buttons sink into the spot their shadow normally occupies
+        self._pressed_rect = self.rect.move(0, self._press_offset)
+        self._bounds = self.rect.union(self._pressed_rect)
+
+        # Glossy highlight overlays for the normal and selected states
+        self._highlights = {
+            selected: self._build_highlight(40 if selected else 25)
+            for selected in (False, True)
+        }
+
+        # Rendered button per visual state, filled in as states are drawn and
+        # dropped when the font, text or colors change
+        self._state_surfaces: list[Optional[pygame.Surface]] = [None] * _SURFACE_SLOTS
+        self._surfaces_key: Optional[tuple] = None
+
+        # Pointer position and disabled flag of the last hover update
+        self._last_hover_key: Optional[tuple] = None
+
+    def _build_highlight(self, opacity: int) -> pygame.Surface:
+        """Render the translucent highlight covering the top half of the button"""
+        highlight_surface = pygame.Surface(
+            (self.original_rect.width, self.original_rect.height // 2), pygame.SRCALPHA
+        )
+        pygame.draw.rect(highlight_surface, (255, 255, 255, opacity),
+                         highlight_surface.get_rect(), border_radius=self.border_radius)
+        return _display_alpha(highlight_surface)
+
+    @property
+    def base_color(self) -> Tuple[int, int, int]:
+        """Color the state colors are derived from"""
+        return self._base_color
+
+    @base_color.setter
+    def base_color(self, color: Tuple[int, int, int]) -> None:
+        self._base_color = color
+        self._compute_palette()
+        self._surfaces_key = None
+
+    @property
+    def text_color(self) -> Tuple[int, int, int]:
+        """Text color of the enabled states"""
+        return self._text_color
+
+    @text_color.setter
+    def text_color(self, color: Tuple[int, int, int]) -> None:
+        self._text_color = color
+        self._compute_palette()
+        self._surfaces_key = None
+
+    def _compute_palette(self) -> None:
+        """Resolve the fill, border and text color of every state up front"""
+        state_fill, state_border, pressed_fill = button_state_colors(self._base_color)
+        self._palette: list[Tuple[Tuple[int, ...], ...]] = []
+        for state in _State:
+            name = state.name.lower()
+            fills = state_fill
+            if name.startswith('pressed_'):
+                name = name[len('pressed_'):]
+                fills = pressed_fill
+            text_color = Colors.TEXT_GRAY if state is _State.DISABLED else self._text_color
+            self._palette.append((fills[name], state_border[name], text_color))
+
+    def _current_state(self) -> _State:
+        """Return the visual state for the disabled, selected, hover and pressed flags"""
+        if self.disabled:
+            return _State.DISABLED
+        if self.selected:
+            state = _State.SELECTED
+        elif self.hover:
+            state = _State.HOVER
+        else:
+            state = _State.NORMAL
+        return _PRESSED_STATES[state] if self._pressed else state
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font,
+             clip_rect: Optional[pygame.Rect] = None) -> None:
+        """Draw the button with consistent state styling
+
+        clip_rect lets callers drawing many widgets query the clip area once;
+        nothing is drawn when the button lies entirely outside it.
+        """
+        if clip_rect is None:
+            clip_rect = surface.get_clip()
+        if not self._bounds.colliderect(clip_rect):
+            return
 
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        """Draw the button with consistent state styling"""
-        # Reset position to original before drawing
-        self.rect = self.original_rect.copy()
+        # Every visual state is rendered once and then reused
+        surfaces_key = (font, self.text)
+        if surfaces_key != self._surfaces_key:
+            self._state_surfaces = [None] * _SURFACE_SLOTS
+            self._surfaces_key = surfaces_key
 
-        # Get base color components
-        r, g, b = self.base_color
+        state = self._current_state()
+        slot = _DISABLED_SELECTED_SLOT if state is _State.DISABLED and self.selected else state
+        state_surface = self._state_surfaces[slot]
+        if state_surface is None:
+            state_surface = self._state_surfaces[slot] = self._render_state(state, font)
+        surface.blit(state_surface, self._bounds)
 
-        # Calculate state-specific colors
-        if self.disabled:
-            fill_color = Colors.WIN_GRAY
-            border_color = Colors.BORDER_GRAY
-            text_color = Colors.TEXT_GRAY
-        else:
-            if self.selected:
-                # Intensify the base color for selected state
-                fill_color = (
-                    min(255, int(r * 1.2)),
-                    min(255, int(g * 1.2)),
-                    min(255, int(b * 1.2))
-                )
-                border_color = (
-                    max(0, int(r * 0.6)),
-                    max(0, int(g * 0.6)),
-                    max(0, int(b * 0.6))
-                )
-                text_color = self.text_color
-            elif self.hover:
-                # Lighten the base color for hover
-                fill_color = (
-                    min(255, int(r * 0.95 + 255 * 0.05)),
-                    min(255, int(g * 0.95 + 255 * 0.05)),
-                    min(255, int(b * 0.95 + 255 * 0.05))
-                )
-                border_color = self.base_color
-                text_color = self.text_color
-            else:
-                # Normal state - slightly lighter than base
-                fill_color = (
-                    min(255, int(r * 0.9 + 255 * 0.1)),
-                    min(255, int(g * 0.9 + 255 * 0.1)),
-                    min(255, int(b * 0.9 + 255 * 0.1))
-                )
-                border_color = self.base_color
-                text_color = self.text_color
+    def _render_state(self, state: _State, font: pygame.font.Font) -> pygame.Surface:
+        """Render the button in one visual state, covering its shadow and pressed area"""
+        state_surface = pygame.Surface(self._bounds.size, pygame.SRCALPHA)
+        offset_x, offset_y = -self._bounds.x, -self._bounds.y
+        shadow_rect = self._pressed_rect.move(offset_x, offset_y)
+
+        pressed = state >= _State.PRESSED_NORMAL
+        disabled = state is _State.DISABLED
+
+        # Pick the precomputed state-specific colors
+        fill_color, border_color, text_color = self._palette[state]
 
         # Apply pressed offset
-        if self._pressed and not self.disabled:
-            self.rect.y += self._press_offset
-            # Darken the fill color when pressed
-            fill_color = tuple(max(0, int(c * 0.8)) for c in fill_color)
+        if pressed:
+            draw_rect = shadow_rect
+        else:
+            draw_rect = self.rect.move(offset_x, offset_y)
 
         # Draw shadow (except when pressed or disabled)
-        if not self.disabled and not self._pressed:
-            shadow_rect = self.rect.copy()
-            shadow_rect.y += self._press_offset
-            pygame.draw.rect(surface, Colors.NAVY_DARKEST, shadow_rect, border_radius=self.border_radius)
+        size = draw_rect.size
+        if not disabled and not pressed:
+            state_surface.blit(rounded_rect(size, self.border_radius, Colors.NAVY_DARKEST), shadow_rect)
 
         # Draw button background
-        pygame.draw.rect(surface, fill_color, self.rect, border_radius=self.border_radius)
+        state_surface.blit(rounded_rect(size, self.border_radius, fill_color), draw_rect)
 
         # Draw border with enhanced width for selected state
         border_width = 2 if self.selected else 1
-        pygame.draw.rect(surface, border_color, self.rect, border_width, border_radius=self.border_radius)
+        state_surface.blit(rounded_rect(size, self.border_radius, border_color, border_width), draw_rect)
 
         # Draw glossy highlight effect
-        if not self._pressed and not self.disabled:
-            highlight_rect = self.rect.copy()
-            highlight_rect.height = self.rect.height // 2
-            highlight_surface = pygame.Surface(highlight_rect.size, pygame.SRCALPHA)
-            highlight_opacity = 40 if self.selected else 25
-            pygame.draw.rect(highlight_surface, (255, 255, 255, highlight_opacity),
-                           highlight_surface.get_rect(), border_radius=self.border_radius)
-            surface.blit(highlight_surface, highlight_rect)
+        if not pressed and not disabled:
+            state_surface.blit(self._highlights[self.selected], draw_rect.topleft)
 
         # Draw text with shadow for depth
-        text_surface = font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-
-        if not self.disabled and not self._pressed:
-            shadow_surface = font.render(self.text, True, (*Colors.NAVY_DARKEST, 100))
-            shadow_rect = shadow_surface.get_rect(center=text_rect.center)
-            shadow_rect.y += 1
-            surface.blit(shadow_surface, shadow_rect)
-
-        surface.blit(text_surface, text_rect)
-
-    def update_hover(self, pos: Tuple[int, int]) -> None:
-        """Update hover state"""
-        self.hover = self.original_rect.collidepoint(pos) and not self.disabled
+        text_surface = render_cached(font, self.text, text_color)
+        text_rect = text_surface.get_rect(center=draw_rect.center)
+
+        if not disabled and not pressed:
+            shadow_surface = render_cached(font, self.text, (*Colors.NAVY_DARKEST, 100))
+            text_shadow_rect = shadow_surface.get_rect(center=text_rect.center)
+            text_shadow_rect.y += 1
+            state_surface.blit(shadow_surface, text_shadow_rect)
+
+        state_surface.blit(text_surface, text_rect)
+        return state_surface.convert_alpha()
+
+    def update_hover(self, pos: Tuple[int, int]) -> bool:
+        """Update hover state, returning True if it changed"""
+        hover_key = (pos, self.disabled)
+        if hover_key == self._last_hover_key:
+            return False
+        self._last_hover_key = hover_key
+
+        hover = self.original_rect.collidepoint(pos) and not self.disabled
+        changed = hover != self.hover
+        self.hover = hover
+        return changed
 
     def handle_click(self, pos: Tuple[int, int]) -> bool:
         """Handle mouse click"""
@@ -138,6 +274,87 @@ class Button:
         """Handle mouse release"""
         self._pressed = False
 
+class WidgetRegistry:
+    """Tracks hover state for a group of widgets with one collision query
+
+    Widgets need ``hover`` and ``disabled`` attributes and are hit-tested
+    against ``original_rect`` when they have one (buttons), ``rect``
+    otherwise. The rect objects are held by reference, so widgets that move
+    in place stay in sync; call rebuild() if a widget replaces its rect.
+    """
+
+    def __init__(self, widgets: Optional[list] = None):
+        self._widgets: list = list(widgets) if widgets else []
+        self._rects: list[pygame.Rect] = []
+        self._hovered: set[int] = set()
+        self._point = pygame.Rect(0, 0, 1, 1)
+        self.rebuild()
+
+    def add(self, widget: Any) -> None:
+        """Start tracking a widget"""
+        self._widgets.append(widget)
+        self.rebuild()
+
+    def remove(self, widget: Any) -> None:
+        """Stop tracking a widget"""
+        self._widgets.remove(widget)
+        widget.hover = False
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Refresh the hit rects after widgets were added, removed or replaced"""
+        self._rects = [getattr(widget, 'original_rect', widget.rect) for widget in self._widgets]
+        self._hovered.clear()
+
+    def update_hover(self, pos: Tuple[int, int]) -> bool:
+        """Update hover state of every widget, returning True if any changed"""
+        self._point.topleft = pos
+        hits = self._point.collidelistall(self._rects)
+        changed = False
+
+        for index in self._hovered.difference(hits):
+            widget = self._widgets[index]
+            changed = changed or widget.hover
+            widget.hover = False
+
+        for index in hits:
+            widget = self._widgets[index]
+            hover = not widget.disabled
+            changed = changed or widget.hover != hover
+            widget.hover = hover
+
+        self._hovered = set(hits)
+        return changed
+
+
+# Prerendered checkboxes keyed by (checked, disabled)
+_CHECKBOX_SIZE = 16
+_CHECKBOX_CACHE: Dict[Tuple[bool, bool], pygame.Surface] = {}
+
+
+def _checkbox_surface(checked: bool, disabled: bool) -> pygame.Surface:
+    """Return the checkbox image for a state, drawing it on first use"""
+    key = (checked, disabled)
+    checkbox = _CHECKBOX_CACHE.get(key)
+    if checkbox is None:
+        checkbox = pygame.Surface((_CHECKBOX_SIZE, _CHECKBOX_SIZE)).convert()
+        checkbox_rect = checkbox.get_rect()
+
+        # Draw checkbox background
+        checkbox.fill(Colors.WHITE)
+        checkbox_color = Colors.BORDER_GRAY if disabled else Colors.HIGHLIGHT
+        pygame.draw.rect(checkbox, checkbox_color, checkbox_rect, 1)
+
+        if checked:
+            # Draw checkmark as a small filled square for cleaner look
+            check_color = Colors.TEXT_GRAY if disabled else Colors.HIGHLIGHT
+            margin = 3
+            pygame.draw.rect(checkbox, check_color, checkbox_rect.inflate(-margin * 2, -margin * 2))
+
+        _CHECKBOX_CACHE[key] = checkbox
+    return checkbox
+
+
 class ListItem:
     """Clickable list item with checkbox"""
 
@@ -148,44 +365,41 @@ class ListItem:
         self.rect = pygame.Rect(0, y_pos, layout.SIDEBAR_WIDTH, layout.LIST_ITEM_HEIGHT)
         self.checkbox_rect = pygame.Rect(
             layout.PADDING,
-            y_pos + (layout.LIST_ITEM_HEIGHT - 16) // 2,
-            16, 16
+            y_pos + (layout.LIST_ITEM_HEIGHT - _CHECKBOX_SIZE) // 2,
+            _CHECKBOX_SIZE, _CHECKBOX_SIZE
         )
         self.hover = False
         self._pressed = False
         self.disabled = False
 
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        """Draw the list item with checkbox"""
+        # Text surface and position, keyed by (text, color, font)
+        self._text_surfaces: Dict[tuple, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font,
+             clip_rect: Optional[pygame.Rect] = None) -> None:
+        """Draw the list item with checkbox, skipping it when outside clip_rect"""
+        if clip_rect is None:
+            clip_rect = surface.get_clip()
+        if not self.rect.colliderect(clip_rect):
+            return
+
         # Draw hover effect
         if self.hover and not self.disabled:
-            pygame.draw.rect(surface, Colors.LIGHT_HIGHLIGHT, self.rect)
+            surface.fill(Colors.LIGHT_HIGHLIGHT, self.rect)
 
         # Draw checkbox
-        # Draw checkbox background
-        pygame.draw.rect(surface, Colors.WHITE, self.checkbox_rect)
-        checkbox_color = Colors.BORDER_GRAY if self.disabled else Colors.HIGHLIGHT
-        pygame.draw.rect(surface, checkbox_color, self.checkbox_rect, 1)
-
-        if self.checked:
-            # Draw checkmark
-            check_color = Colors.TEXT_GRAY if self.disabled else Colors.HIGHLIGHT
-            margin = 3
-            # Draw checkmark as a small filled square for cleaner look
-            inner_rect = pygame.Rect(
-                self.checkbox_rect.x + margin,
-                self.checkbox_rect.y + margin,
-                self.checkbox_rect.width - (margin * 2),
-                self.checkbox_rect.height - (margin * 2)
-            )
-            pygame.draw.rect(surface, check_color, inner_rect)
+        surface.blit(_checkbox_surface(self.checked, self.disabled), self.checkbox_rect)
 
         # Draw text
         text_color = Colors.TEXT_GRAY if self.disabled else Colors.BLACK
-        text_surface = font.render(self.text, True, text_color)
-        text_pos = (self.checkbox_rect.right + self.layout.PADDING,
-                    self.rect.centery - text_surface.get_height() // 2)
-        surface.blit(text_surface, text_pos)
+        key = (self.text, text_color, font)
+        text = self._text_surfaces.get(key)
+        if text is None:
+            text_surface = render_cached(font, self.text, text_color)
+            text_pos = (self.checkbox_rect.right + self.layout.PADDING,
+                        self.rect.centery - text_surface.get_height() // 2)
+            text = self._text_surfaces[key] = (text_surface, text_pos)
+        surface.blit(*text)
 
     def update_hover(self, pos: Tuple[int, int]) -> None:
         """Update hover state"""
@@ -211,6 +425,12 @@ class ListItem:
 class StatsPanel:
     """Panel displaying player statistics"""
 
+    # Color never used by the panel, marks the transparent rounded corners
+    _CORNER_KEY = (255, 0, 255)
+
+    # Joined operator symbols per operator combination, shared by all panels
+    _OPERATOR_LABELS: Dict[tuple, str] = {}
+
     def __init__(self, layout: Layout):
         self.layout = layout
         self.game_session: Optional[Any] = None
@@ -222,28 +442,80 @@ class StatsPanel:
             self.panel_height
         )
 
+        # Panel contents are rendered into a backing surface, which is only
+        # refreshed when the displayed stats change or the panel is invalidated.
+        # It is opaque, with its rounded corners masked out by a color key.
+        self._cache_surface = pygame.Surface(self.rect.size).convert()
+        self._cache_surface.set_colorkey(self._CORNER_KEY)
+        self._stats_sig: Optional[tuple] = None
+        self._dirty = True
+
     def set_game_session(self, session: Any) -> None:
         """Set the game session to display stats for"""
         self.game_session = session
+        self._dirty = True
+
+    def invalidate(self) -> None:
+        """Re-render the panel on the next draw, e.g. after the stats changed"""
+        self._dirty = True
+
+    def on_resize(self, window_height: int) -> None:
+        """Keep the panel anchored to the bottom of the resized window"""
+        self.rect.bottom = window_height - self.layout.PADDING
 
-    def draw(self, surface: pygame.Surface, fonts: Dict[str, pygame.font.Font]) -> None:
-        """Draw the stats panel"""
+    def draw(self, surface: pygame.Surface, fonts: Dict[str, pygame.font.Font],
+             clip_rect: Optional[pygame.Rect] = None) -> None:
+        """Draw the stats panel, skipping it when outside clip_rect"""
         if not self.game_session:
             return
 
-        # Update rect position
-        self.rect.bottom = self.layout.WINDOW_HEIGHT - self.layout.PADDING
+        if clip_rect is None:
+            clip_rect = surface.get_clip()
+        if not self.rect.colliderect(clip_rect):
+            return
+
+        stats_sig = self._stats_signature()
+        if self._dirty or stats_sig != self._stats_sig:
+            self._cache_surface.fill(self._CORNER_KEY)
+            self._render(self._cache_surface, fonts, self.game_session.get_stats())
+            self._stats_sig = stats_sig
+            self._dirty = False
+
+        surface.blit(self._cache_surface, self.rect)
+
+    def _stats_signature(self) -> tuple:
+        """Return the session values the panel shows, read without building the stats dict"""
+        session = self.game_session
+        player = session.player
+        record = player.recent_sessions[-1]
+        return (
+            player.name, record.correct, record.problems_attempted,
+            player.current_streak, player.best_streak,
+            session.state.difficulty, tuple(session.state.selected_operators)
+        )
+
+    def _operators_display(self, operators: tuple) -> str:
+        """Return the operator symbols as a comma separated string"""
+        label = self._OPERATOR_LABELS.get(operators)
+        if label is None:
+            label = ', '.join(GameSettings.OPERATION_SYMBOLS[op] for op in operators)
+            self._OPERATOR_LABELS[operators] = label
+        return label
+
+    def _render(self, surface: pygame.Surface, fonts: Dict[str, pygame.font.Font],
+                stats: Dict[str, Any]) -> None:
+        """Render the panel contents in panel-local coordinates"""
+        panel_rect = surface.get_rect()
 
         # Draw panel background with light fill and border
-        pygame.draw.rect(surface, Colors.WHITE, self.rect, border_radius=4)
-        pygame.draw.rect(surface, Colors.BORDER_GRAY, self.rect, 1, border_radius=4)
+        surface.blit(rounded_rect(panel_rect.size, 4, Colors.WHITE), panel_rect)
+        surface.blit(rounded_rect(panel_rect.size, 4, Colors.BORDER_GRAY, 1), panel_rect)
 
         # Draw player name
-        name_surface = fonts['normal'].render(
-            self.game_session.player.name, True, Colors.BLACK)
+        name_surface = render_cached(fonts['normal'], self.game_session.player.name, Colors.BLACK)
         name_rect = name_surface.get_rect(
-            left=self.rect.left + self.layout.PADDING,
-            top=self.rect.top + self.layout.PADDING
+            left=panel_rect.left + self.layout.PADDING,
+            top=panel_rect.top + self.layout.PADDING
         )
         surface.blit(name_surface, name_rect)
 
@@ -251,12 +523,11 @@ class StatsPanel:
         separator_y = name_rect.bottom + self.layout.PADDING
         pygame.draw.line(
             surface, Colors.BORDER_GRAY,
-            (self.rect.left + self.layout.PADDING, separator_y),
-            (self.rect.right - self.layout.PADDING, separator_y)
+            (panel_rect.left + self.layout.PADDING, separator_y),
+            (panel_rect.right - self.layout.PADDING, separator_y)
         )
 
-        # Get and display stats
-        stats = self.game_session.get_stats()
+        # Display stats
         y = separator_y + self.layout.PADDING
         padding = 5
 
@@ -270,9 +541,9 @@ class StatsPanel:
         ]
 
         for text, color in stats_display:
-            text_surface = fonts['small'].render(text, True, color)
+            text_surface = render_cached(fonts['small'], text, color)
             surface.blit(text_surface, (
-                self.rect.left + self.layout.PADDING,
+                panel_rect.left + self.layout.PADDING,
                 y
             ))
             y += text_surface.get_height() + padding
@@ -281,21 +552,21 @@ class StatsPanel:
         separator_y = y + padding
         pygame.draw.line(
             surface, Colors.BORDER_GRAY,
-            (self.rect.left + self.layout.PADDING, separator_y),
-            (self.rect.right - self.layout.PADDING, separator_y)
+            (panel_rect.left + self.layout.PADDING, separator_y),
+            (panel_rect.right - self.layout.PADDING, separator_y)
         )
 
         # Draw mode info
         y = separator_y + padding * 2
         mode_info = [
             f"Mode: {stats['difficulty']}",
-            f"Operations: {', '.join(GameSettings.OPERATION_SYMBOLS[op] for op in stats['operators'])}"
+            f"Operations: {self._operators_display(tuple(stats['operators']))}"
         ]
 
         for text in mode_info:
-            text_surface = fonts['small'].render(text, True, Colors.TEXT_GRAY)
+            text_surface = render_cached(fonts['small'], text, Colors.TEXT_GRAY)
             surface.blit(text_surface, (
-                self.rect.left + self.layout.PADDING,
+                panel_rect.left + self.layout.PADDING,
                 y
             ))
             y += text_surface.get_height() + padding
@@ -307,12 +578,38 @@ class ScrollableList:
     def __init__(self, rect: pygame.Rect, items: list[str],
                  item_height: int, max_visible: int):
         self.rect = rect
-        self.items = items
         self.item_height = item_height
         self.max_visible = max_visible
         self.scroll_offset = 0
         self.selected_index = -1
         self.hover_index = -1
+        # Pointer position and visible rows of the last hover update
+        self._last_hover_key: Optional[tuple] = None
+
+        # The list body is rendered into a backing surface and only refreshed
+        # when its key (scroll offset, selection, item count and font)
+        # changes or the list is invalidated; the hover highlight is drawn
+        # over it so hovering never invalidates it
+        self._cache_surface = pygame.Surface(rect.size)
+        if pygame.display.get_surface() is not None:
+            self._cache_surface = self._cache_surface.convert()
+        self._cache_key: Optional[tuple] = None
+
+        # Row rects for each visible slot, reused on every draw
+        self._item_rects = [
+            pygame.Rect(rect.left, rect.top + i * item_height, rect.width, item_height)
+            for i in range(max_visible)
+        ]
+
+        # Separator lines between all rows, drawn once on a transparent strip
+        # so rendering the list needs one blit instead of a line per row
+        self._separators = pygame.Surface((rect.width, max_visible * item_height + 1), pygame.SRCALPHA)
+        for i in range(1, max_visible):
+            pygame.draw.line(
+                self._separators, Colors.BORDER_GRAY,
+                (0, i * item_height), (rect.width, i * item_height)
+            )
+        self._separators = _display_alpha(self._separators)
 
         # Create scroll buttons
         button_width = 25
@@ -330,71 +627,123 @@ class ScrollableList:
             "↓"
         )
 
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        """Draw the scrollable list"""
-        # Draw list background
-        pygame.draw.rect(surface, Colors.WHITE, self.rect)
-        pygame.draw.rect(surface, Colors.BORDER_GRAY, self.rect, 1)
-
-        # Draw visible items
-        visible_items = self.items[self.scroll_offset:
-                                   self.scroll_offset + self.max_visible]
-        for i, item in enumerate(visible_items):
-            item_rect = pygame.Rect(
-                self.rect.left,
-                self.rect.top + i * self.item_height,
-                self.rect.width,
-                self.item_height
-            )
+        self.items = items
+
+    @property
+    def items(self) -> list[str]:
+        """Items shown in the list"""
+        return self._items
+
+    @items.setter
+    def items(self, items: list[str]) -> None:
+        self._items = items
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Re-render the list on the next draw, e.g. after items changed in place"""
+        self._cache_key = None
+        # The scroll buttons are only shown and hit-tested when they can scroll
+        self._scrollable = len(self.items) > self.max_visible
+        self._update_scroll_buttons()
+
+    def _update_scroll_buttons(self) -> None:
+        """Disable the scroll buttons that cannot move the list any further"""
+        self.scroll_up.disabled = self.scroll_offset == 0
+        self.scroll_down.disabled = (self.scroll_offset >=
+                                     len(self.items) - self.max_visible)
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font,
+             clip_rect: Optional[pygame.Rect] = None) -> None:
+        """Draw the scrollable list, skipping parts that lie outside clip_rect"""
+        if clip_rect is None:
+            clip_rect = surface.get_clip()
+        if self.rect.colliderect(clip_rect):
+            self._draw_body(surface, font)
+
+        # Draw scroll buttons if needed
+        if self._scrollable:
+            self.scroll_up.draw(surface, font, clip_rect)
+            self.scroll_down.draw(surface, font, clip_rect)
+
+    def _draw_body(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
+        """Blit the cached list body and draw the hover highlight over it"""
+        cache_key = (self.scroll_offset, self.selected_index, len(self.items), font)
+        if cache_key != self._cache_key:
+            self._render(self._cache_surface, font)
+            self._cache_key = cache_key
+        surface.blit(self._cache_surface, self.rect)
+
+        # Draw hover highlight over the cached body
+        hover_slot = self.hover_index - self.scroll_offset
+        if (0 <= hover_slot < self.max_visible and
+                self.hover_index < len(self.items) and
+                self.hover_index != self.selected_index):
+            item_rect = self._item_rects[hover_slot]
+            surface.fill(Colors.LIGHT_HIGHLIGHT, item_rect)
+            text_surface = render_cached(font, self.items[self.hover_index], Colors.BLACK)
+            surface.blit(text_surface, text_surface.get_rect(
+                left=item_rect.left + 10,
+                centery=item_rect.centery
+            ))
 
-            # Draw selection/hover highlight
-            real_index = i + self.scroll_offset
+    def _render(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
+        """Render the list body in list-local coordinates"""
+        # Draw list background
+        list_rect = surface.get_rect()
+        pygame.draw.rect(surface, Colors.WHITE, list_rect)
+        pygame.draw.rect(surface, Colors.BORDER_GRAY, list_rect, 1)
+
+        items = self.items
+        visible_count = min(self.max_visible, len(items) - self.scroll_offset)
+
+        # Draw separator lines between the visible items; a selected row's
+        # highlight covers the line above it
+        if visible_count > 1:
+            separators_height = (visible_count - 1) * self.item_height + 1
+            surface.blit(self._separators, (0, 0), (0, 0, list_rect.width, separators_height))
+
+        # Draw visible items; highlights go straight to the surface while
+        # the text is collected and blitted in one batch
+        text_blits = []
+        start = self.scroll_offset
+        for i, real_index in enumerate(range(start, start + visible_count)):
+            item = items[real_index]
+            item_rect = self._item_rects[i].move(-self.rect.x, -self.rect.y)
+
+            # Draw selection highlight
             if real_index == self.selected_index:
-                pygame.draw.rect(surface, Colors.HIGHLIGHT, item_rect)
+                surface.fill(Colors.HIGHLIGHT, item_rect)
                 text_color = Colors.WHITE
-            elif real_index == self.hover_index:
-                pygame.draw.rect(surface, Colors.LIGHT_HIGHLIGHT, item_rect)
-                text_color = Colors.BLACK
             else:
                 text_color = Colors.BLACK
 
             # Draw item text
-            text_surface = font.render(item, True, text_color)
+            text_surface = render_cached(font, item, text_color)
             text_rect = text_surface.get_rect(
                 left=item_rect.left + 10,
                 centery=item_rect.centery
             )
-            surface.blit(text_surface, text_rect)
+            text_blits.append((text_surface, text_rect))
 
-            # Draw separator line
-            if i < len(visible_items) - 1:
-                pygame.draw.line(
-                    surface, Colors.BORDER_GRAY,
-                    (item_rect.left, item_rect.bottom),
-                    (item_rect.right, item_rect.bottom)
-                )
+        surface.blits(text_blits, doreturn=False)
 
-        # Draw scroll buttons if needed
-        if len(self.items) > self.max_visible:
-            self.scroll_up.disabled = self.scroll_offset == 0
-            self.scroll_down.disabled = (self.scroll_offset >=
-                                         len(self.items) - self.max_visible)
-            self.scroll_up.draw(surface, font)
-            self.scroll_down.draw(surface, font)
-
-    def handle_click(self, pos: Tuple[int, int]) -> Optional[str]:
-        """Handle mouse click and return selected item if any"""
+    def handle_click(self, pos: Tuple[int, int], button: int = 1) -> Optional[str]:
+        """Handle mouse click and return selected item if any
+
+        button is the mouse button from the click event, 1 being the left one.
+        """
         # Check scroll buttons
-        if self.scroll_up.handle_click(pos):
-            self.scroll(-1)
-            return None
+        if self._scrollable:
+            if self.scroll_up.handle_click(pos):
+                self.scroll(-1)
+                return None
 
-        if self.scroll_down.handle_click(pos):
-            self.scroll(1)
-            return None
+            if self.scroll_down.handle_click(pos):
+                self.scroll(1)
+                return None
 
         # Only handle selection on left click
-        if pygame.mouse.get_pressed()[0]:  # Left click
+        if button == 1:
             # Check item clicks
             if self.rect.collidepoint(pos):
                 y_offset = pos[1] - self.rect.top
@@ -416,7 +765,7 @@ class ScrollableList:
 
     def scroll(self, direction: int) -> None:
         """Scroll the list up or down"""
-        if len(self.items) <= self.max_visible:
+        if not self._scrollable:
             return
 
         new_offset = self.scroll_offset + direction
@@ -425,12 +774,23 @@ class ScrollableList:
         max_offset = len(self.items) - self.max_visible
         new_offset = max(0, min(new_offset, max_offset))
 
-        self.scroll_offset = new_offset
+        if new_offset != self.scroll_offset:
+            self.scroll_offset = new_offset
+            self._update_scroll_buttons()
 
-    def update_hover(self, pos: Tuple[int, int]) -> None:
-        """Update hover states"""
-        self.scroll_up.update_hover(pos)
-        self.scroll_down.update_hover(pos)
+    def update_hover(self, pos: Tuple[int, int]) -> bool:
+        """Update hover states, returning True if any of them changed"""
+        # Hover only depends on the pointer and the rows under it
+        hover_key = (pos, self.scroll_offset, len(self.items))
+        if hover_key == self._last_hover_key:
+            return False
+        self._last_hover_key = hover_key
+
+        changed = False
+        if self._scrollable:
+            changed = self.scroll_up.update_hover(pos)
+            changed = self.scroll_down.update_hover(pos) or changed
+        previous_index = self.hover_index
 
         if self.rect.collidepoint(pos):
             y_offset = pos[1] - self.rect.top
@@ -438,4 +798,6 @@ class ScrollableList:
             if 0 <= hover_index < len(self.items):
                 self.hover_index = hover_index
         else:
-            self.hover_index = -1
\ No newline at end of file
+            self.hover_index = -1
+
+        return changed or self.hover_index != previous_index
\ No newline at end of file